@@ -1,7 +1,9 @@
 #!/usr/bin/env bash
 # Set up dependencies for Journal.
 #
-# Creates a virtual environment and installs prompt_toolkit + pygments.
+# Creates a virtual environment and installs prompt_toolkit + pygments,
+# plus rapidfuzz for fast fuzzy search (optional — journal.py falls back
+# to difflib without it).
 # If pip is not available, prompt_toolkit can also be vendored manually.
 
 set -e
@@ -16,6 +18,6 @@ if [ ! -d "${SCRIPT_DIR}/.venv" ]; then
 fi
 
 echo "  Installing dependencies..."
-"${SCRIPT_DIR}/.venv/bin/pip" install --quiet prompt_toolkit pygments
+"${SCRIPT_DIR}/.venv/bin/pip" install --quiet prompt_toolkit pygments rapidfuzz
 
 echo "Done. Run with: ./run.sh"
@@ -3,8 +3,10 @@
 Tests for journal data models, .bib parsing, and export helpers.
 """
 
+import io
 import os
 import tempfile
+import xml.etree.ElementTree as ET
 import zipfile
 from pathlib import Path
 
@@ -20,7 +22,7 @@ from journal import (
     detect_pandoc, detect_libreoffice,
     _generate_lua_filter, _lua_basic_filter,
     _lua_coverpage_filter, _lua_header_filter,
-    _postprocess_docx, _REFS_DIR,
+    _postprocess_docx, _postprocess_docx_bytes, _REFS_DIR,
     _list_continuation, _ensure_writable, MarkdownLexer,
     _get_foot_font_size, _set_foot_font_size, COLOR_SCHEMES,
 )
@@ -170,6 +172,13 @@ def test_fuzzy_filter():
     assert len(results) >= 1
     assert results[0].citekey == "smith2020"
 
+    # Repetitive citekey: "hahahaha" has only 2 distinct bigrams, so the
+    # prefilter threshold must clamp or an exact query finds nothing.
+    entries.append(BibEntry(citekey="hahahaha"))
+    results = fuzzy_filter(entries, "hahahaha")
+    assert len(results) >= 1
+    assert results[0].citekey == "hahahaha"
+
     print("  Fuzzy filter OK")
 
 
@@ -187,6 +196,13 @@ def test_fuzzy_filter_entries():
     results = fuzzy_filter_entries(entries, "")
     assert len(results) == 3
 
+    # Exact name made of one repeated character (1 distinct bigram).
+    entries.append(
+        Entry(path=Path("/tmp/aaaaaaaa.md"), name="aaaaaaaa", modified=400.0))
+    results = fuzzy_filter_entries(entries, "aaaaaaaa")
+    assert len(results) >= 1
+    assert results[0].name == "aaaaaaaa"
+
     print("  Fuzzy filter entries OK")
 
 
@@ -290,67 +306,103 @@ def test_lua_filter_generation():
     print("  Dispatcher OK")
 
 
-def test_postprocess_docx():
-    with tempfile.TemporaryDirectory() as tmpdir:
-        docx_path = os.path.join(tmpdir, "test.docx")
-
-        # Create a minimal DOCX zip with a header containing {{LASTNAME}}
-        header_xml = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+_HEADER_XML = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <w:hdr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
   <w:p><w:r><w:t>{{LASTNAME}} </w:t></w:r></w:p>
 </w:hdr>"""
-        footer_xml = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+
+_FOOTER_XML = b"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
 <w:ftr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">
   <w:p><w:r><w:t>Page footer</w:t></w:r></w:p>
 </w:ftr>"""
-        with zipfile.ZipFile(docx_path, "w") as zf:
-            zf.writestr("word/header1.xml", header_xml)
-            zf.writestr("word/footer1.xml", footer_xml)
-            zf.writestr("word/document.xml", b"<w:document/>")
-
-        # Test coverpage format: strips headers, keeps footers, replaces lastname
-        _postprocess_docx(docx_path, {"author": "John Smith", "style": "chicago"})
-        with zipfile.ZipFile(docx_path, "r") as zf:
-            header = zf.read("word/header1.xml").decode("utf-8")
-            footer = zf.read("word/footer1.xml").decode("utf-8")
-            # Header should be stripped (empty)
-            assert "{{LASTNAME}}" not in header
-            assert "Smith" not in header  # stripped, not replaced
-            assert "Header" in header  # has the empty header style
-            # Footer should be preserved
-            assert "Page footer" in footer
-        print("  Coverpage postprocess OK")
-
-        # Rebuild for header format test
-        with zipfile.ZipFile(docx_path, "w") as zf:
-            zf.writestr("word/header1.xml", header_xml)
-            zf.writestr("word/footer1.xml", footer_xml)
-            zf.writestr("word/document.xml", b"<w:document/>")
-
-        # Test header format: keeps headers (with replacement), strips footers
+
+
+def _make_docx_bytes(members):
+    """Build a minimal in-memory DOCX zip from {name: data}."""
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return buf.getvalue()
+
+
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+
+def _member_text(zf, name):
+    """Concatenated text content of a zipped XML member.
+
+    Parsing (rather than substring-matching the raw bytes) also proves
+    the postprocessor emitted well-formed XML.
+    """
+    return "".join(ET.fromstring(zf.read(name)).itertext())
+
+
+def _member_styles(zf, name):
+    """w:val attributes of every pStyle element in a zipped XML member."""
+    root = ET.fromstring(zf.read(name))
+    return [e.get(f"{_W_NS}val") for e in root.iter(f"{_W_NS}pStyle")]
+
+
+def test_postprocess_docx():
+    # Everything runs through the in-memory bytes API; no temp files.
+    src = _make_docx_bytes({
+        "word/header1.xml": _HEADER_XML,
+        "word/footer1.xml": _FOOTER_XML,
+        "word/document.xml": b"<w:document/>",
+    })
+
+    # Test coverpage format: strips headers, keeps footers, replaces lastname
+    out = _postprocess_docx_bytes(src, {"author": "John Smith", "style": "chicago"})
+    with zipfile.ZipFile(io.BytesIO(out)) as zf:
+        header = _member_text(zf, "word/header1.xml")
+        # Header should be stripped (empty)
+        assert "{{LASTNAME}}" not in header
+        assert "Smith" not in header  # stripped, not replaced
+        assert _member_styles(zf, "word/header1.xml") == ["Header"]
+        # Footer should be preserved
+        assert "Page footer" in _member_text(zf, "word/footer1.xml")
+    print("  Coverpage postprocess OK")
+
+    # Test header format: keeps headers (with replacement), strips footers
+    out = _postprocess_docx_bytes(src, {"author": "Jane Doe", "style": "mla"})
+    with zipfile.ZipFile(io.BytesIO(out)) as zf:
+        header = _member_text(zf, "word/header1.xml")
+        footer = _member_text(zf, "word/footer1.xml")
+        # Header should have lastname replaced
+        assert "Doe " in header
+        assert "{{LASTNAME}}" not in header
+        # Footer should be stripped
+        assert "Page footer" not in footer
+        assert _member_styles(zf, "word/footer1.xml") == ["Footer"]
+    print("  Header postprocess OK")
+
+    # No author: placeholder removed, not replaced
+    src_no_footer = _make_docx_bytes({
+        "word/header1.xml": _HEADER_XML,
+        "word/document.xml": b"<w:document/>",
+    })
+    out = _postprocess_docx_bytes(src_no_footer, {"style": "mla"})
+    with zipfile.ZipFile(io.BytesIO(out)) as zf:
+        assert "{{LASTNAME}}" not in _member_text(zf, "word/header1.xml")
+    print("  No-author postprocess OK")
+
+    # No header/footer members at all: returned unchanged, same object
+    src_bare = _make_docx_bytes({"word/document.xml": b"<w:document/>"})
+    assert _postprocess_docx_bytes(src_bare, {"style": "mla"}) is src_bare
+    print("  No-op postprocess OK")
+
+    # The file-path variant shares the same core; one on-disk round trip
+    # keeps the temp-file + atomic-replace plumbing covered.
+    with tempfile.TemporaryDirectory() as tmpdir:
+        docx_path = os.path.join(tmpdir, "test.docx")
+        with open(docx_path, "wb") as f:
+            f.write(src)
         _postprocess_docx(docx_path, {"author": "Jane Doe", "style": "mla"})
-        with zipfile.ZipFile(docx_path, "r") as zf:
-            header = zf.read("word/header1.xml").decode("utf-8")
-            footer = zf.read("word/footer1.xml").decode("utf-8")
-            # Header should have lastname replaced
-            assert "Doe " in header
-            assert "{{LASTNAME}}" not in header
-            # Footer should be stripped
-            assert "Page footer" not in footer
-            assert "Footer" in footer  # has the empty footer style
-        print("  Header postprocess OK")
-
-        # Rebuild for no-author test
-        with zipfile.ZipFile(docx_path, "w") as zf:
-            zf.writestr("word/header1.xml", header_xml)
-            zf.writestr("word/document.xml", b"<w:document/>")
-
-        _postprocess_docx(docx_path, {"style": "mla"})
-        with zipfile.ZipFile(docx_path, "r") as zf:
-            header = zf.read("word/header1.xml").decode("utf-8")
-            # No author: placeholder removed, not replaced
-            assert "{{LASTNAME}}" not in header
-        print("  No-author postprocess OK")
+        with zipfile.ZipFile(docx_path) as zf:
+            assert "Doe " in _member_text(zf, "word/header1.xml")
+        assert not os.path.exists(docx_path + ".tmp")
+    print("  File-path postprocess OK")
 
 
 def test_detect_tools():